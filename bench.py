@@ -0,0 +1,647 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Měření výkonu horkých cest (sken /a/<uuid> apod.).
+
+Spouští se nad dočasnou syntetickou databází, produkční data se nepoužijí:
+
+    python bench.py scan --companies 5 --accs 200 --threads 8 --seconds 5
+    python bench.py render --rows 300
+    python bench.py serve --workers 1 2 4
+    python bench.py startup --runs 10 --json
+    python bench.py suite --out before.json   # ... změna ...
+    python bench.py suite --out after.json
+    python bench.py compare before.json after.json
+    python bench.py tokens --processes 4
+    python bench.py backup --accs 200 --scans 500000
+"""
+
+import argparse
+import http.client
+import io
+import json
+import multiprocessing
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+# 1x1 PNG – stačí jako "skutečný" soubor akreditace
+TINY_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000d49444154789c6360606060000000050001a5f645400000000049454e44ae426082"
+)
+
+HERE = Path(__file__).resolve().parent
+BENCH_USER = ("bench", "bench")
+
+def load_app(data_dir: Path, config: dict = None):
+    """Vrací (modul app, Flask aplikace) nad daty v data_dir."""
+    sys.path.insert(0, str(HERE))
+    import app as appmod
+    flask_app = appmod.create_app({"DATA_DIR": data_dir,
+                                   "ADMIN_USERNAME": BENCH_USER[0], "ADMIN_PASSWORD": BENCH_USER[1],
+                                   **(config or {})})
+    appmod.ensure_dirs()
+    appmod.init_db()
+    return appmod, flask_app
+
+def sample_photo() -> bytes:
+    """JPEG 1200×900 (~450 kB) – velikostí odpovídá zmenšené fotce z mobilu."""
+    from PIL import Image
+    buf = io.BytesIO()
+    Image.effect_noise((1200, 900), 20).convert("RGB").save(buf, "JPEG", quality=85)
+    return buf.getvalue()
+
+def seed(appmod, companies: int, accs: int, source: bytes = TINY_PNG, ext: str = "png", qr: bool = False,
+         unique: bool = False):
+    """Založí firmy bench-<i> po `accs` akreditacích; vrací UUID v pořadí firem.
+
+    Soubor jde přes blob store jako při uploadu (stage_blob/add_blob) – všechny akreditace
+    sdílí jeden blob a jeho varianty, stejně jako stejná fotka nahraná víckrát.
+    `unique` = každá akreditace vlastní blob (source + pár bajtů navíc), jako různé fotky.
+    """
+    con = appmod.connect_db()
+    uuids = []
+    qr_jobs = []
+
+    def add_source(extra: bytes = b""):
+        staged = appmod.stage_blob(io.BytesIO(source + extra), ext)
+        blob_variants = appmod.add_blob(con, staged)
+        if blob_variants is None:
+            appmod.enqueue_blob_derivatives(con, staged.name)
+        return staged, appmod._acc_variants(blob_variants)
+
+    staged, variants = (None, None) if unique else add_source()
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    for ci in range(companies):
+        slug = f"bench-{ci}"
+        cur = con.execute("INSERT INTO companies(name,slug) VALUES(?,?)", (f"Bench {ci}", slug))
+        company_id = cur.lastrowid
+        for _ in range(accs):
+            u = str(uuid.uuid4())
+            if unique:
+                staged, variants = add_source(u.encode())
+            con.execute("""INSERT INTO accreditations(uuid,company_id,title,filename,file_hash,blob,variants,
+                                                      active,created_at)
+                           VALUES(?,?,?,?,?,?,?,?,?)""",
+                        (u, company_id, f"Osoba {u[:8]}", f"source.{ext}", staged.hash, staged.name, variants, 1, now))
+            uuids.append(u)
+            if qr:
+                qr_jobs.append((f"http://bench.local/a/{u}", str(appmod.UPLOAD_DIR / slug / u / "qr.png")))
+    con.commit()
+    # varianty hned (jako worker fronty po uploadu), ať se měří stránka se srcset
+    while appmod.run_one_job(con):
+        pass
+    con.close()
+    errors = appmod.render_qr_parallel(qr_jobs)
+    if errors:
+        raise RuntimeError(f"QR se nepodařilo vygenerovat: {next(iter(errors.values()))}")
+    return uuids
+
+def drive(flask_app, paths, threads: int, seconds: float, login: bool = False):
+    """Paralelně volá dané URL přes testovacího klienta, vrací seznam latencí."""
+    stop = time.perf_counter() + seconds
+    latencies = []
+    lock = threading.Lock()
+
+    def worker():
+        client = flask_app.test_client()
+        if login:
+            client.post("/admin/login", data={"username": BENCH_USER[0], "password": BENCH_USER[1]})
+        local = []
+        rnd = random.Random()
+        while time.perf_counter() < stop:
+            path = rnd.choice(paths)
+            t0 = time.perf_counter()
+            resp = client.get(path)
+            resp.get_data()  # soubory se posílají streamem – započítat i jejich přečtení
+            resp.close()
+            local.append(time.perf_counter() - t0)
+            if resp.status_code != 200:
+                raise RuntimeError(f"{path} -> {resp.status_code}")
+        with lock:
+            latencies.extend(local)
+
+    ts = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in ts:
+        t.start()
+    for t in ts:
+        t.join()
+    return latencies
+
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return 0.0
+    k = min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))
+    return values[k]
+
+def summarize(latencies, seconds, errors: int = 0) -> dict:
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / seconds, 1),
+        **{f"p{p}_ms": round(percentile(latencies, p) * 1000, 3) for p in (50, 95, 99)},
+        "max_ms": round(max(latencies, default=0.0) * 1000, 3),
+    }
+
+def report(name, latencies, seconds):
+    r = summarize(latencies, seconds)
+    print(f"{name}: {r['rps']:8.1f} req/s  p50={r['p50_ms']:.2f} ms  p95={r['p95_ms']:.2f} ms  "
+          f"p99={r['p99_ms']:.2f} ms  (n={r['requests']})")
+
+def background_writer(appmod, uuids, stop: threading.Event, hold: float):
+    """Simuluje admina, který během skenování přepíná akreditace."""
+    con = appmod.sqlite3.connect(appmod.DB_PATH, timeout=30)
+    rnd = random.Random(1)
+    while not stop.is_set():
+        con.execute("UPDATE accreditations SET active=1-active WHERE uuid=?", (rnd.choice(uuids),))
+        time.sleep(hold)  # transakce drží zámek jako pomalý upload
+        con.commit()
+        time.sleep(0.001)
+    con.close()
+
+def cmd_scan(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        appmod, flask_app = load_app(Path(tmp))
+        uuids = seed(appmod, args.companies, args.accs)
+        paths = [f"/a/{u}" for u in uuids]
+        drive(flask_app, paths, args.threads, 0.5)  # zahřátí
+        stop = threading.Event()
+        writer = None
+        if args.writer:
+            writer = threading.Thread(target=background_writer, args=(appmod, uuids, stop, args.writer_hold))
+            writer.start()
+        try:
+            lat = drive(flask_app, paths, args.threads, args.seconds)
+        finally:
+            stop.set()
+            if writer:
+                writer.join()
+        label = " + writer" if args.writer else ""
+        report(f"public_accreditation x{args.threads}{label}", lat, args.seconds)
+
+def timeit(fn, repeat: int) -> float:
+    fn()  # zahřátí (první kompilace šablony)
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+def cmd_render(args):
+    """Čas renderu šablon: kompilace při každém volání vs. šablona z cache loaderu."""
+    with tempfile.TemporaryDirectory() as tmp:
+        appmod, flask_app = load_app(Path(tmp))
+        from flask import render_template, render_template_string
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        company = {"id": 1, "name": "Bench", "slug": "bench"}
+        accs = [{"uuid": str(uuid.uuid4()), "title": f"Osoba {i}", "filename": "source.png", "variants": None, "file_hash": None,
+                 "active": i % 3 != 0, "created_at": now} for i in range(args.rows)]
+
+        def file_url(a):
+            return f"/uploads/bench/{a['uuid']}/{a['filename']}"
+
+        cases = [
+            ("public_page.html", appmod.PUBLIC_PAGE,
+             dict(acc=accs[0], company=company, file_url=file_url(accs[0]))),
+            ("company_page.html", appmod.COMPANY_PAGE,
+             dict(company=company, accs=accs, user="admin", file_url=file_url, q="", after=None, next_cursor=None)),
+        ]
+        with flask_app.test_request_context("/", base_url="http://bench.local"):
+            for name, source, ctx in cases:
+                per_string = timeit(lambda: render_template_string(source, **ctx), args.repeat)
+                per_cached = timeit(lambda: render_template(name, **ctx), args.repeat)
+                print(f"{name:18} ({args.rows} řádků): "
+                      f"render_template_string {per_string * 1000:8.3f} ms  "
+                      f"render_template {per_cached * 1000:8.3f} ms  "
+                      f"({per_string / per_cached:.1f}x)")
+
+def _http_client(port: int, paths, seconds: float, headers=None):
+    """Jeden klient s keep-alive spojením – běží v samostatném procesu."""
+    headers = headers or {}
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    rnd = random.Random()
+    latencies = []
+    errors = 0
+    stop = time.perf_counter() + seconds
+    while time.perf_counter() < stop:
+        path = rnd.choice(paths)
+        t0 = time.perf_counter()
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            resp.read()
+            if resp.status != 200:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+            continue
+        latencies.append(time.perf_counter() - t0)
+    conn.close()
+    return latencies, errors
+
+def http_drive(port: int, paths, clients: int, seconds: float, headers=None):
+    """Zatíží běžící server `clients` procesy; vrací (latence, počet chyb)."""
+    with ProcessPoolExecutor(max_workers=clients) as pool:
+        futures = [pool.submit(_http_client, port, paths, seconds, headers) for _ in range(clients)]
+        latencies, errors = [], 0
+        for fut in futures:
+            lat, err = fut.result()
+            latencies += lat
+            errors += err
+    return latencies, errors
+
+def http_login(port: int) -> dict:
+    """Přihlásí benchmark admina, vrací hlavičku Cookie pro admin stránky."""
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    body = f"username={BENCH_USER[0]}&password={BENCH_USER[1]}"
+    conn.request("POST", "/admin/login", body=body,
+                 headers={"Content-Type": "application/x-www-form-urlencoded"})
+    resp = conn.getresponse()
+    resp.read()
+    cookie = resp.getheader("Set-Cookie")
+    conn.close()
+    if resp.status != 302 or not cookie:
+        raise RuntimeError(f"přihlášení selhalo ({resp.status})")
+    return {"Cookie": cookie.split(";", 1)[0]}
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def start_server(data_dir: Path, workers: int, threads: int):
+    """Spustí produkční server (python app.py) nad daty benchmarku, počká na /healthz."""
+    port = _free_port()
+    env = dict(os.environ, DATA_DIR=str(data_dir))
+    proc = subprocess.Popen(
+        [sys.executable, str(HERE / "app.py"),
+         "--bind", f"127.0.0.1:{port}", "--workers", str(workers), "--threads", str(threads)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            conn = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            conn.request("GET", "/healthz")
+            if conn.getresponse().status == 200:
+                return proc, port
+        except OSError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("server nenaběhl")
+
+def stop_server(proc):
+    proc.terminate()
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+def cmd_serve(args):
+    """Škálování req/s na /a/<uuid> podle počtu worker procesů."""
+    with tempfile.TemporaryDirectory() as tmp:
+        appmod, _ = load_app(Path(tmp))
+        uuids = seed(appmod, args.companies, args.accs)
+        paths = [f"/a/{u}" for u in uuids]
+        print(f"CPU: {os.cpu_count()}, klientů: {args.clients}, vláken/worker: {args.threads}")
+        for workers in args.workers:
+            proc, port = start_server(Path(tmp), workers, args.threads)
+            try:
+                http_drive(port, paths, args.clients, 1.0)  # zahřátí
+                lat, errors = http_drive(port, paths, args.clients, args.seconds)
+            finally:
+                stop_server(proc)
+            report(f"/a/<uuid> workers={workers}", lat, args.seconds)
+            if errors:
+                print(f"  chyb: {errors}")
+
+def suite_scenarios(appmod, uuids, accs: int, filename: str):
+    """{jméno routy: (URL, vyžaduje přihlášení)} pro sadu `suite`."""
+    def slug(i):
+        return f"bench-{i // accs}"
+    con = appmod.sqlite3.connect(appmod.DB_PATH)
+    version = con.execute("SELECT file_hash FROM accreditations LIMIT 1").fetchone()[0][:16]
+    con.close()
+    companies = sorted({slug(i) for i in range(len(uuids))})
+    return {
+        "public_accreditation": ([f"/a/{u}" for u in uuids], False),
+        "qr_image": ([f"/qr/{u}.png" for u in uuids], False),
+        "uploaded_file": ([f"/uploads/{slug(i)}/{u}/{filename}?v={version}" for i, u in enumerate(uuids)], False),
+        "admin_home": (["/admin"], True),
+        "admin_company": ([f"/admin/company/{s}" for s in companies], True),
+    }
+
+def cmd_suite(args):
+    """Propustnost a p50/p95/p99 horkých cest skenu i adminu; výsledek jako JSON."""
+    with tempfile.TemporaryDirectory() as tmp:
+        appmod, flask_app = load_app(Path(tmp))
+        photo = sample_photo()
+        uuids = seed(appmod, args.companies, args.accs, source=photo, ext="jpg", qr=True)
+        scenarios = suite_scenarios(appmod, uuids, args.accs, "source.jpg")
+        selected = args.only or list(scenarios)
+        results = {}
+        proc = port = cookie = None
+        if args.server:
+            proc, port = start_server(Path(tmp), args.workers, args.threads)
+            cookie = http_login(port)
+        try:
+            for name in selected:
+                paths, login = scenarios[name]
+                if args.server:
+                    headers = cookie if login else None
+                    http_drive(port, paths, args.clients, args.warmup, headers)
+                    lat, errors = http_drive(port, paths, args.clients, args.seconds, headers)
+                else:
+                    drive(flask_app, paths, args.clients, args.warmup, login=login)
+                    lat, errors = drive(flask_app, paths, args.clients, args.seconds, login=login), 0
+                results[name] = summarize(lat, args.seconds, errors)
+                report(f"{name:21}", lat, args.seconds)
+                if errors:
+                    print(f"  chyb: {errors}")
+        finally:
+            if proc is not None:
+                stop_server(proc)
+    out = {
+        "meta": {
+            "at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "cpu": os.cpu_count(),
+            "mode": f"server workers={args.workers} threads={args.threads}" if args.server else "test_client",
+            "companies": args.companies,
+            "accs": args.accs,
+            "clients": args.clients,
+            "seconds": args.seconds,
+            "file_bytes": len(photo),
+        },
+        "results": results,
+    }
+    if args.out:
+        Path(args.out).write_text(json.dumps(out, indent=2) + "\n", encoding="utf-8")
+        print(f"Výsledek uložen do {args.out}")
+
+def _change(base: float, new: float) -> str:
+    return f"{(new - base) / base * 100:+.1f} %" if base else "n/a"
+
+def cmd_compare(args):
+    """Porovná dva výsledky `suite`; při regresi končí s kódem 1."""
+    base = json.loads(Path(args.base).read_text(encoding="utf-8"))
+    new = json.loads(Path(args.new).read_text(encoding="utf-8"))
+    for key in ("mode", "companies", "accs", "clients", "cpu"):
+        if base["meta"].get(key) != new["meta"].get(key):
+            print(f"pozor: liší se {key}: {base['meta'].get(key)} → {new['meta'].get(key)}")
+    limit = args.threshold / 100
+    regressions = 0
+    for name, b in base["results"].items():
+        n = new["results"].get(name)
+        if n is None:
+            print(f"{name:21} chybí v {args.new}")
+            continue
+        flags = []
+        if n["rps"] < b["rps"] * (1 - limit):
+            flags.append("req/s")
+        for key in ("p50_ms", "p95_ms", "p99_ms"):
+            if n[key] > b[key] * (1 + limit) and n[key] - b[key] >= args.min_ms:
+                flags.append(key[:-3])
+        if n["errors"] > b["errors"]:
+            flags.append("chyby")
+        regressions += bool(flags)
+        print(f"{name:21} req/s {b['rps']:8.1f} → {n['rps']:8.1f} ({_change(b['rps'], n['rps'])})  "
+              f"p95 {b['p95_ms']:.2f} → {n['p95_ms']:.2f} ms ({_change(b['p95_ms'], n['p95_ms'])})  "
+              f"p99 {b['p99_ms']:.2f} → {n['p99_ms']:.2f} ms"
+              + (f"  REGRESE: {', '.join(flags)}" if flags else ""))
+    if regressions:
+        print(f"{regressions} rout(y) zhoršeny o víc než {args.threshold:g} %")
+        sys.exit(1)
+    print("Bez regresí.")
+
+# Spouští se v čistém interpretu: import app → create_app() → první request
+STARTUP_PROBE = r'''
+import json, sys, time
+t0 = time.perf_counter()
+import app
+t1 = time.perf_counter()
+flask_app = app.create_app()
+t2 = time.perf_counter()
+resp = flask_app.test_client().get(sys.argv[1])
+t3 = time.perf_counter()
+if resp.status_code != 200:
+    raise SystemExit(f"{sys.argv[1]} -> {resp.status_code}")
+print(json.dumps({"import": t1 - t0, "create_app": t2 - t1, "first_request": t3 - t2,
+                  "heavy_modules": [m for m in ("qrcode", "PIL", "concurrent.futures.process") if m in sys.modules]}))
+'''
+
+def cmd_startup(args):
+    """Studený start: čas importu, create_app() a prvního /a/<uuid> v novém procesu."""
+    with tempfile.TemporaryDirectory() as tmp:
+        appmod, _ = load_app(Path(tmp))
+        path = f"/a/{seed(appmod, 1, 1)[0]}"
+        env = dict(os.environ, DATA_DIR=tmp, JOB_WORKERS="0")
+        runs = []
+        for _ in range(args.runs):
+            t0 = time.perf_counter()
+            out = subprocess.run([sys.executable, "-c", STARTUP_PROBE, path], cwd=HERE, env=env,
+                                 check=True, capture_output=True, text=True).stdout
+            run = json.loads(out.splitlines()[-1])
+            run["process"] = time.perf_counter() - t0
+            runs.append(run)
+    phases = ("import", "create_app", "first_request", "process")
+    result = {
+        "runs": args.runs,
+        "python": sys.version.split()[0],
+        "heavy_modules": runs[-1]["heavy_modules"],
+        **{p: {"p50_ms": round(percentile([r[p] for r in runs], 50) * 1000, 2),
+               "max_ms": round(max(r[p] for r in runs) * 1000, 2)} for p in phases},
+    }
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+    for p in phases:
+        print(f"{p:14} p50={result[p]['p50_ms']:8.2f} ms  max={result[p]['max_ms']:8.2f} ms")
+    print(f"načtené těžké moduly po prvním requestu: {', '.join(result['heavy_modules']) or '–'}")
+
+def _verify_loop(tokens, seconds: float):
+    """Ověřuje tokeny dokola v jednom procesu; vrací (počet, doba)."""
+    import app as appmod
+    verify = appmod.verify_token
+    verify(tokens[0])  # načtení seznamu zneplatněných mimo měření
+    n = 0
+    t0 = time.perf_counter()
+    deadline = t0 + seconds
+    while time.perf_counter() < deadline:
+        for t in tokens:
+            verify(t)
+        n += len(tokens)
+    return n, time.perf_counter() - t0
+
+def cmd_tokens(args):
+    """Ověření podepsaných QR tokenů: čistá funkce na jádro, škálování přes procesy
+    a HTTP /api/token proti /api/verify (dotaz do DB)."""
+    keys = "bench2:" + "b" * 43 + ",bench1:" + "a" * 43
+    with tempfile.TemporaryDirectory() as tmp:
+        appmod, flask_app = load_app(Path(tmp), {"QR_SIGNING_KEYS": keys})
+        uuids = seed(appmod, args.companies, args.accs)
+        con = appmod.connect_db()
+        # každá desátá deaktivovaná – token musí projít i seznamem zneplatněných
+        con.executemany("UPDATE accreditations SET active=0 WHERE uuid=?", [(u,) for u in uuids[::10]])
+        con.commit()
+        companies = dict(con.execute("SELECT uuid, company_id FROM accreditations").fetchall())
+        con.close()
+        tokens = [appmod.sign_token(u, companies[u]) for u in uuids]
+        assert appmod.verify_token(tokens[1])["valid"] and not appmod.verify_token(tokens[0])["valid"]
+
+        n, elapsed = _verify_loop(tokens, args.seconds)
+        single = n / elapsed
+        print(f"{'verify_token, 1 proces':26}: {single:12.0f} ověření/s na jádro ({elapsed / n * 1e6:.2f} µs)")
+        if args.processes > 1:
+            ctx = multiprocessing.get_context("fork")
+            with ProcessPoolExecutor(args.processes, mp_context=ctx) as pool:
+                runs = list(pool.map(_verify_loop, [tokens] * args.processes, [args.seconds] * args.processes))
+            total = sum(n / el for n, el in runs)
+            print(f"{f'verify_token, {args.processes} procesů':26}: {total:12.0f} ověření/s celkem, "
+                  f"{total / args.processes:.0f} na proces (cpu: {os.cpu_count()})")
+
+        valid = [f"/api/token/{t}" for i, t in enumerate(tokens) if i % 10]  # drive() chce 200
+        drive(flask_app, valid[:50], args.threads, 0.3)  # zahřátí
+        report(f"/api/token x{args.threads}", drive(flask_app, valid, args.threads, args.seconds), args.seconds)
+        report(f"/api/verify x{args.threads}", drive(flask_app, [f"/api/verify/{u}" for u in uuids],
+                                                     args.threads, args.seconds), args.seconds)
+
+def _flask(data_dir: Path, *args):
+    """`flask --app app ...` v samostatném procesu (jako z cronu); vrací dobu běhu."""
+    t0 = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "flask", "--app", "app", *args], cwd=HERE, check=True,
+                   env=dict(os.environ, DATA_DIR=str(data_dir), JOB_WORKERS="0"), capture_output=True)
+    return time.perf_counter() - t0
+
+def cmd_backup(args):
+    """Online záloha: propustnost plné a přírůstkové zálohy a obnovy a dopad
+    běžící zálohy (samostatný proces) na latenci /a/<uuid>."""
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp) / "data"
+        appmod, flask_app = load_app(data_dir)
+        uuids = seed(appmod, args.companies, args.accs, source=sample_photo(), ext="jpg", unique=True)
+        con = appmod.connect_db()
+        accs = con.execute("SELECT id, company_id FROM accreditations").fetchall()
+        rnd = random.Random(1)
+        now = time.time()
+        for i in range(0, args.scans, 10000):  # historie skenů – aby DB měla víc než pár stránek
+            appmod.write_scans(con, [(*rnd.choice(accs), now - rnd.random() * 30 * 86400)
+                                     for _ in range(min(10000, args.scans - i))])
+            con.commit()
+        con.close()
+        paths = [f"/a/{u}" for u in uuids]
+        drive(flask_app, paths, args.threads, 0.5)  # zahřátí
+        report(f"{'/a/<uuid> bez zálohy':24}", drive(flask_app, paths, args.threads, args.seconds), args.seconds)
+
+        out = Path(tmp) / "full.tar"
+        result = {}
+        runner = threading.Thread(target=lambda: result.update(seconds=_flask(data_dir, "backup", str(out))))
+        runner.start()
+        lat, t0 = [], time.perf_counter()
+        while runner.is_alive():  # zátěž po celou dobu zálohy
+            lat += drive(flask_app, paths, args.threads, 0.25)
+        runner.join()
+        report(f"{'/a/<uuid> během zálohy':24}", lat, time.perf_counter() - t0)
+
+        def show(name, manifest, seconds):
+            mb = manifest["bytes"] / 1024 / 1024
+            print(f"{name:24}: {mb:8.1f} MB za {seconds:.2f} s = {mb / seconds:7.1f} MB/s "
+                  f"(DB {manifest['db']['pages']} stránek, restartů {manifest['db']['restarts']}, "
+                  f"souborů {manifest['added']})")
+
+        full = json.loads(Path(f"{out}.manifest.json").read_text())
+        show("plná záloha", full, full["seconds"])
+        inc = Path(tmp) / "inc.tar"
+        _flask(data_dir, "backup", str(inc), "--since", f"{out}.manifest.json")
+        manifest = json.loads(Path(f"{inc}.manifest.json").read_text())
+        show("přírůstková záloha", manifest, manifest["seconds"])
+
+        seconds = _flask(Path(tmp) / "restored", "restore", str(out), str(inc))
+        mb = (out.stat().st_size + inc.stat().st_size) / 1024 / 1024
+        print(f"{'obnova (vč. startu)':24}: {mb:8.1f} MB za {seconds:.2f} s = {mb / seconds:7.1f} MB/s")
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("scan", help="propustnost /a/<uuid> při souběžném zatížení")
+    p.add_argument("--companies", type=int, default=5)
+    p.add_argument("--accs", type=int, default=200)
+    p.add_argument("--threads", type=int, default=8)
+    p.add_argument("--seconds", type=float, default=5.0)
+    p.add_argument("--writer", action="store_true", help="souběžně zapisovat (přepínání stavu)")
+    p.add_argument("--writer-hold", type=float, default=0.005, help="jak dlouho writer drží transakci [s]")
+    p.set_defaults(func=cmd_scan)
+
+    p = sub.add_parser("render", help="mikrobenchmark renderu šablon")
+    p.add_argument("--rows", type=int, default=300)
+    p.add_argument("--repeat", type=int, default=200)
+    p.set_defaults(func=cmd_render)
+
+    p = sub.add_parser("serve", help="zátěžový test produkčního serveru podle počtu workerů")
+    p.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    p.add_argument("--threads", type=int, default=4)
+    p.add_argument("--clients", type=int, default=8)
+    p.add_argument("--companies", type=int, default=5)
+    p.add_argument("--accs", type=int, default=200)
+    p.add_argument("--seconds", type=float, default=5.0)
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("suite", help="sada: sken, QR, soubory a admin – req/s a p50/p95/p99 jako JSON")
+    p.add_argument("--companies", type=int, default=5)
+    p.add_argument("--accs", type=int, default=200)
+    p.add_argument("--clients", type=int, default=8, help="souběžných klientů (vláken, se --server procesů)")
+    p.add_argument("--seconds", type=float, default=5.0, help="délka měření jedné routy")
+    p.add_argument("--warmup", type=float, default=0.5)
+    p.add_argument("--only", nargs="+", choices=["public_accreditation", "qr_image", "uploaded_file",
+                                                 "admin_home", "admin_company"])
+    p.add_argument("--server", action="store_true", help="měřit přes HTTP proti produkčnímu serveru")
+    p.add_argument("--workers", type=int, default=2)
+    p.add_argument("--threads", type=int, default=4)
+    p.add_argument("--out", help="kam uložit JSON s výsledky")
+    p.set_defaults(func=cmd_suite)
+
+    p = sub.add_parser("compare", help="porovnání dvou běhů suite, hlásí regrese")
+    p.add_argument("base")
+    p.add_argument("new")
+    p.add_argument("--threshold", type=float, default=10.0, help="tolerance zhoršení v %%")
+    p.add_argument("--min-ms", type=float, default=0.5, help="menší absolutní nárůst latence se ignoruje")
+    p.set_defaults(func=cmd_compare)
+
+    p = sub.add_parser("startup", help="studený start: import + create_app + první request")
+    p.add_argument("--runs", type=int, default=10)
+    p.add_argument("--json", action="store_true", help="výsledek jako JSON (pro sledování mezi verzemi)")
+    p.set_defaults(func=cmd_startup)
+
+    p = sub.add_parser("tokens", help="ověřování podepsaných QR tokenů za sekundu (na jádro i přes procesy)")
+    p.add_argument("--companies", type=int, default=5)
+    p.add_argument("--accs", type=int, default=200)
+    p.add_argument("--seconds", type=float, default=3.0)
+    p.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    p.add_argument("--threads", type=int, default=8, help="vláken pro HTTP část")
+    p.set_defaults(func=cmd_tokens)
+
+    p = sub.add_parser("backup", help="online záloha a obnova: MB/s a dopad na latenci /a/<uuid>")
+    p.add_argument("--companies", type=int, default=2)
+    p.add_argument("--accs", type=int, default=100, help="akreditací na firmu (~450 kB fotka každá)")
+    p.add_argument("--scans", type=int, default=200000, help="skenů v historii (velikost DB)")
+    p.add_argument("--threads", type=int, default=8)
+    p.add_argument("--seconds", type=float, default=3.0)
+    p.set_defaults(func=cmd_backup)
+
+    args = ap.parse_args(argv)
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
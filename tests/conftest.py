@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Sdílené fixtury: jedna aplikace nad dočasnými daty pro celý běh testů.
+
+Nastavení platí pro celý proces (viz create_app), proto se aplikace nesestavuje
+pro každý test znovu – testy si zakládají vlastní firmy a akreditace.
+"""
+
+import io
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import app as appmod  # noqa: E402
+
+ADMIN = ("test", "test")
+
+# 1x1 PNG
+TINY_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000d49444154789c6360606060000000050001a5f645400000000049454e44ae426082"
+)
+
+@pytest.fixture(scope="session")
+def app(tmp_path_factory):
+    flask_app = appmod.create_app({"DATA_DIR": tmp_path_factory.mktemp("data"), "JOB_WORKERS": 0, "TESTING": True,
+                                   "ADMIN_USERNAME": ADMIN[0], "ADMIN_PASSWORD": ADMIN[1]})
+    appmod.ensure_dirs()
+    appmod.init_db()
+    return flask_app
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+@pytest.fixture
+def admin(app):
+    c = app.test_client()
+    c.post("/admin/login", data={"username": ADMIN[0], "password": ADMIN[1]})
+    return c
+
+@pytest.fixture
+def company(admin):
+    """Nová firma; vrací její slug."""
+    slug = f"t-{uuid.uuid4().hex[:8]}"
+    admin.post("/admin/company/new", data={"name": slug, "slug": slug})
+    return slug
+
+def add_accreditation(admin, slug: str, title: str = "Osoba", data: bytes = TINY_PNG, name: str = "x.png"):
+    """Nahraje akreditaci přes admin a vrací její řádek z DB."""
+    admin.post(f"/admin/company/{slug}/add", data={"title": title, "file": (io.BytesIO(data), name)},
+               content_type="multipart/form-data")
+    con = appmod.connect_db()
+    try:
+        return con.execute("""SELECT a.* FROM accreditations a JOIN companies c ON c.id=a.company_id
+                              WHERE c.slug=? ORDER BY a.id DESC LIMIT 1""", (slug,)).fetchone()
+    finally:
+        con.close()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""API pro čtečky: feed změn jen s tokenem čtečky."""
+
+import pytest
+
+from conftest import add_accreditation, appmod
+
+@pytest.fixture
+def scanner_token(monkeypatch):
+    monkeypatch.setattr(appmod, "SCANNER_TOKENS", "ctecka-1, ctecka-2")
+    return "ctecka-2"
+
+@pytest.mark.parametrize("headers", [{}, {"Authorization": "Bearer spatny"}, {"Authorization": "Basic ctecka-2"},
+                                     {"Authorization": "Bearer "}])
+def test_changes_feed_requires_token(admin, client, company, scanner_token, headers):
+    acc = add_accreditation(admin, company, "Jan Tajný")
+    resp = client.get("/api/changes", headers=headers)
+    assert resp.status_code == 401
+    body = resp.get_data(as_text=True)
+    assert acc["uuid"] not in body and "Tajný" not in body
+
+def test_changes_feed_closed_without_configured_tokens(client, monkeypatch):
+    monkeypatch.setattr(appmod, "SCANNER_TOKENS", "")
+    assert client.get("/api/changes", headers={"Authorization": "Bearer "}).status_code == 401
+
+def test_changes_feed_with_token(admin, client, company, scanner_token):
+    acc = add_accreditation(admin, company)
+    resp = client.get("/api/changes", headers={"Authorization": f"Bearer {scanner_token}"})
+    assert resp.status_code == 200
+    assert acc["uuid"] in {c["uuid"] for c in resp.get_json()["changes"]}
+    assert admin.get("/api/changes").status_code == 200
+
+def test_revocations_require_token(admin, client, company, scanner_token, monkeypatch):
+    monkeypatch.setattr(appmod, "QR_SIGNING_KEYS", "k1:" + "ab" * 16)
+    acc = add_accreditation(admin, company)
+    admin.post(f"/admin/company/{company}/{acc['uuid']}/toggle")
+    resp = client.get("/api/revocations")
+    assert resp.status_code == 401
+    assert acc["uuid"] not in resp.get_data(as_text=True)
+    assert client.get("/api/revocations", headers={"Authorization": f"Bearer {scanner_token}"}).status_code == 200
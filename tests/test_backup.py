@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+"""Obnova ze zálohy: cesty z archivu nesmí mířit mimo UPLOAD_DIR."""
+
+import io
+import json
+import tarfile
+
+import pytest
+
+from conftest import appmod
+
+def incremental_archive(path, base: dict, deleted):
+    manifest = dict(base, id="podvrh", base=base["id"], files={}, deleted=deleted)
+    data = json.dumps(manifest).encode()
+    with tarfile.open(path, "w") as tar:
+        info = tarfile.TarInfo("manifest.json")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+
+@pytest.mark.parametrize("rel", ["../victim.txt", "a/../../victim.txt", "/tmp/victim.txt", ""])
+def test_restore_rejects_deleted_paths_outside_uploads(app, tmp_path, rel):
+    full = tmp_path / "full.tar"
+    with open(full, "wb") as out:
+        base = appmod.write_backup(out)
+    victim = appmod.UPLOAD_DIR.parent / "victim.txt"
+    victim.write_text("zůstane")
+    evil = tmp_path / "evil.tar"
+    incremental_archive(evil, base, [rel.replace("/tmp/victim.txt", str(victim))])
+    db_before = appmod.DB_PATH.stat().st_ino
+    with pytest.raises(ValueError, match="Neplatná cesta"):
+        appmod.restore_backup([full, evil], force=True)
+    assert victim.read_text() == "zůstane"
+    assert appmod.DB_PATH.stat().st_ino == db_before
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""Cache lookupů akreditací mezi procesy."""
+
+from conftest import add_accreditation, appmod
+
+def deactivate_elsewhere(acc):
+    """Deaktivace jako z jiného workeru: vlastní spojení, bez invalidace acc_cache v tomto procesu."""
+    con = appmod.connect_db()
+    try:
+        con.execute("UPDATE accreditations SET active=0 WHERE id=?", (acc["id"],))
+        appmod.log_changes(con, [(acc["uuid"], acc["company_id"], "update", 0)])
+        con.commit()
+    finally:
+        con.close()
+
+def test_change_from_other_process_invalidates_cache(admin, client, company):
+    acc = add_accreditation(admin, company)
+    client.get(f"/a/{acc['uuid']}")  # naplní acc_cache
+    assert client.get(f"/api/verify/{acc['uuid']}").get_json()["active"] is True
+    deactivate_elsewhere(acc)
+    assert client.get(f"/api/verify/{acc['uuid']}").get_json()["active"] is False
+
+def test_stale_put_is_dropped(admin, company):
+    acc = add_accreditation(admin, company)
+    with admin.application.app_context():
+        seq = appmod.sync_acc_cache(appmod.get_db())
+        deactivate_elsewhere(acc)
+        appmod.sync_acc_cache(appmod.get_db())
+        appmod.acc_cache.put(acc["uuid"], "stale", seq)
+        assert appmod.acc_cache.get(acc["uuid"]) is None
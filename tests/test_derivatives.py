@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Náhledy PDF pro varianty."""
+
+import sys
+import threading
+
+from conftest import appmod
+
+# náhradní pdftoppm: obrázek v barvě podle prvního bajtu "PDF", s prodlevou, aby se běhy překryly
+FAKE_PDFTOPPM = """#!{python}
+import sys, time
+from PIL import Image
+src, prefix = sys.argv[-2], sys.argv[-1]
+shade = open(src, "rb").read(1)[0]
+time.sleep(0.3)
+Image.new("RGB", (4, 4), (shade, shade, shade)).save(prefix + ".png")
+"""
+
+def test_concurrent_pdf_previews_in_shared_folder(tmp_path, monkeypatch):
+    exe = tmp_path / "pdftoppm"
+    exe.write_text(FAKE_PDFTOPPM.format(python=sys.executable))
+    exe.chmod(0o755)
+    monkeypatch.setitem(sys.modules, "pymupdf", None)  # i s PyMuPDF jít přes pdftoppm
+    monkeypatch.setattr(appmod.shutil, "which", lambda name: str(exe) if name == "pdftoppm" else None)
+    shard = tmp_path / "ab"
+    shard.mkdir()
+    sources = {shade: shard / f"{shade}.pdf" for shade in (10, 200)}
+    for shade, path in sources.items():
+        path.write_bytes(bytes([shade]))
+
+    results = {}
+    threads = [threading.Thread(target=lambda s=s, p=p: results.update({s: appmod.render_pdf_first_page(p)}))
+               for s, p in sources.items()]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert {shade: img.getpixel((0, 0))[0] for shade, img in results.items()} == {10: 10, 200: 200}
+    assert sorted(p.name for p in shard.iterdir()) == ["10.pdf", "200.pdf"]
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+"""create_app() bez dalších kroků – tak, jak ho spustí gunicorn 'app:create_app()' nebo flask run."""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+FRESH_APP = """
+import json, sys
+import app
+flask_app = app.create_app({"JOB_WORKERS": 0})
+c = flask_app.test_client()
+print(json.dumps({
+    "healthz": c.get("/healthz").status_code,
+    "verify": c.get("/api/verify/00000000-0000-0000-0000-000000000000").status_code,
+    "public": c.get("/a/00000000-0000-0000-0000-000000000000").status_code,
+    "key": flask_app.config["SECRET_KEY"].hex(),
+}))
+"""
+
+def run_fresh(data_dir: Path) -> dict:
+    env = {k: v for k, v in os.environ.items() if k != "SECRET_KEY"}
+    env["DATA_DIR"] = str(data_dir)
+    out = subprocess.run([sys.executable, "-c", FRESH_APP], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+def test_factory_prepares_fresh_data_dir(tmp_path):
+    first = run_fresh(tmp_path / "data")
+    assert (first["healthz"], first["verify"], first["public"]) == (200, 404, 404)
+    # další worker (bez --preload) dostane stejný klíč session
+    assert run_fresh(tmp_path / "data")["key"] == first["key"]
+    assert (tmp_path / "data" / "secret_key").stat().st_mode & 0o077 == 0
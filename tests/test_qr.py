@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""Paralelní render QR z vícevláknového procesu."""
+
+import threading
+import time
+
+from conftest import appmod
+
+def test_parallel_render_survives_held_metrics_lock(app, tmp_path):
+    """Zámek metrik držený jiným vláknem nesmí pool procesů zablokovat."""
+    stop = threading.Event()
+
+    def hold_lock():
+        while not stop.is_set():
+            with appmod.metrics._lock:
+                time.sleep(0.02)
+
+    holder = threading.Thread(target=hold_lock, daemon=True)
+    holder.start()
+    jobs = [(f"http://test.local/a/{i}", str(tmp_path / f"qr{i}.png")) for i in range(8)]
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(errors=appmod.render_qr_parallel(jobs, 2)), daemon=True)
+    try:
+        worker.start()
+        worker.join(60)
+    finally:
+        stop.set()
+    assert not worker.is_alive(), "render_qr_parallel visí"
+    assert result["errors"] == {}
+    assert all((tmp_path / f"qr{i}.png").stat().st_size > 0 for i in range(8))
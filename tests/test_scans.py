@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Návštěvnost: součty skenů a smazané akreditace."""
+
+from conftest import add_accreditation, appmod
+
+def company_id(slug):
+    con = appmod.connect_db()
+    try:
+        return con.execute("SELECT id FROM companies WHERE slug=?", (slug,)).fetchone()[0]
+    finally:
+        con.close()
+
+def test_deleted_accreditation_leaves_analytics(admin, client, company):
+    kept = add_accreditation(admin, company, "Zůstane")
+    gone = add_accreditation(admin, company, "Smazaná")
+    for acc in (kept, gone, gone):
+        client.get(f"/a/{acc['uuid']}")
+    appmod.scan_buffer.flush()
+    admin.post(f"/admin/company/{company}/{gone['uuid']}/delete")
+    client.get(f"/a/{gone['uuid']}")
+    con = appmod.connect_db()
+    try:
+        # sken zaznamenaný těsně před smazáním a zapsaný až po něm
+        appmod.write_scans(con, [(gone["id"], gone["company_id"], 1.0e9)])
+        con.commit()
+        stats = appmod.company_scan_stats(con, company_id(company), 30)
+    finally:
+        con.close()
+    assert (stats["badges"], stats["scans"]) == (1, 1)
+    assert [r["uuid"] for r in stats["top"]] == [kept["uuid"]]
+
+def test_analytics_days_clamped(admin, company):
+    page = admin.get(f"/admin/company/{company}/analytics?days=365")
+    assert page.status_code == 200
+    assert page.get_data(as_text=True).count("<div title=") <= 30 * 24 + 1  # hodinové sloupce
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+"""Hledání akreditací v administraci."""
+
+import pytest
+
+from conftest import add_accreditation
+
+@pytest.mark.parametrize("q", ['"', '""', '" "', '"" ""'])
+def test_quotes_only_search_finds_nothing(admin, company, q):
+    add_accreditation(admin, company, "Karel Hledaný")
+    for url in (f"/admin/company/{company}", "/admin/search"):
+        resp = admin.get(url, query_string={"q": q})
+        assert resp.status_code == 200
+        assert "Karel Hledaný" not in resp.get_data(as_text=True)
+
+def test_search_with_quotes_matches_words(admin, company):
+    add_accreditation(admin, company, "Karel Hledaný")
+    resp = admin.get(f"/admin/company/{company}", query_string={"q": '"hleda'})
+    assert "Karel Hledaný" in resp.get_data(as_text=True)
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""Doručení /uploads: offload na proxy a přístup jen k souborům akreditace."""
+
+import builtins
+import io
+
+import flask
+import pytest
+
+from conftest import add_accreditation, appmod
+
+def forbid_upload_reads(monkeypatch):
+    """Od této chvíle selže každé otevření souboru pod UPLOAD_DIR; vrací seznam pokusů."""
+    opened = []
+    real_open = builtins.open
+
+    def guarded_open(file, *args, **kwargs):
+        if isinstance(file, (str, bytes, appmod.Path)) and str(appmod.UPLOAD_DIR) in str(file):
+            opened.append(str(file))
+            raise AssertionError(f"upload otevřen v Pythonu: {file}")
+        return real_open(file, *args, **kwargs)
+
+    monkeypatch.setattr(builtins, "open", guarded_open)
+    monkeypatch.setattr(io, "open", guarded_open)
+    return opened
+
+@pytest.mark.parametrize("mode", ["x-accel", "x-sendfile"])
+def test_sendfile_mode_passes_no_bytes(admin, client, company, monkeypatch, mode):
+    acc = add_accreditation(admin, company)
+    monkeypatch.setattr(appmod, "SENDFILE_MODE", mode)
+    opened = forbid_upload_reads(monkeypatch)
+    resp = client.get(f"/uploads/{company}/{acc['uuid']}/{acc['filename']}")
+    assert resp.status_code == 200
+    assert resp.get_data() == b""
+    assert resp.headers["Content-Type"] == "image/png"
+    path = appmod.stored_path(company, acc, acc["filename"])
+    if mode == "x-accel":
+        rel = path.relative_to(appmod.UPLOAD_DIR).as_posix()
+        assert resp.headers["X-Accel-Redirect"] == f"{appmod.SENDFILE_ACCEL_PREFIX.rstrip('/')}/{rel}"
+        assert "X-Sendfile" not in resp.headers
+    else:
+        assert resp.headers["X-Sendfile"] == str(path.resolve())
+        assert "X-Accel-Redirect" not in resp.headers
+    assert opened == []
+
+def test_python_mode_serves_file(admin, client, company):
+    acc = add_accreditation(admin, company)
+    resp = client.get(f"/uploads/{company}/{acc['uuid']}/{acc['filename']}")
+    assert resp.status_code == 200
+    assert resp.get_data() == appmod.stored_path(company, acc, acc["filename"]).read_bytes()
+
+@pytest.mark.parametrize("mode", ["", "x-accel", "x-sendfile"])
+@pytest.mark.parametrize("name", ["..%2F..%2F..%2Fapp.db", "..%2F..%2F..%2F..%2Fapp.db", "../../../app.db",
+                                  "..%2F..%2F..%2F..%2F..%2F..%2Fetc%2Fpasswd", "jiny.png", "qr.png%2F..%2F..%2F..%2F..%2Fapp.db"])
+def test_only_known_files_are_served(admin, client, company, monkeypatch, mode, name):
+    acc = add_accreditation(admin, company)
+    monkeypatch.setattr(appmod, "SENDFILE_MODE", mode)
+    resp = client.get(f"/uploads/{company}/{acc['uuid']}/{name}")
+    assert resp.status_code == 404
+    assert "X-Accel-Redirect" not in resp.headers and "X-Sendfile" not in resp.headers
+    assert b"SQLite format" not in resp.get_data()
+
+def test_qr_png_is_served_from_accreditation_folder(admin, client, company):
+    acc = add_accreditation(admin, company)
+    qr = appmod.UPLOAD_DIR / company / acc["uuid"] / "qr.png"
+    qr.parent.mkdir(parents=True, exist_ok=True)
+    qr.write_bytes(b"png")
+    resp = client.get(f"/uploads/{company}/{acc['uuid']}/qr.png")
+    assert (resp.status_code, resp.get_data()) == (200, b"png")
+
+@pytest.mark.parametrize("slug, expected", [("_blobs", "blobs"), (".hidden", "hidden"), ("Acme Corp", "acme-corp")])
+def test_custom_company_slug_is_normalised(admin, slug, expected):
+    resp = admin.post("/admin/company/new", data={"name": f"Firma {slug}", "slug": slug})
+    assert resp.status_code == 302
+    assert resp.headers["Location"].endswith(f"/admin/company/{expected}")
+    con = appmod.connect_db()
+    try:
+        assert con.execute("SELECT 1 FROM companies WHERE slug=?", (slug,)).fetchone() is None
+    finally:
+        con.close()
+
+def test_oversized_upload_rejected_before_body_is_read(admin, company, monkeypatch):
+    monkeypatch.setattr(appmod, "MAX_UPLOAD_BYTES", 1024)
+
+    def no_parse(self, *args, **kwargs):
+        raise AssertionError("tělo requestu se nemělo číst")
+
+    monkeypatch.setattr(flask.Request, "_load_form_data", no_parse)
+    tmp_dir = appmod.UPLOAD_DIR / appmod.BLOB_DIRNAME / ".tmp"
+    before = set(tmp_dir.iterdir()) if tmp_dir.exists() else set()
+    resp = admin.post(f"/admin/company/{company}/add",
+                      data={"title": "Velký", "file": (io.BytesIO(b"x" * 200_000), "x.png")},
+                      content_type="multipart/form-data")
+    assert resp.status_code == 302
+    assert (set(tmp_dir.iterdir()) if tmp_dir.exists() else set()) == before